@@ -11,6 +11,7 @@ export class HttpProcessManager {
   #handler: MessageHandler
   #process: ChildProcess | null = null
   #httpPort: number | null = null
+  #httpSocket: string | null = null
 
   constructor(commands: string[], args: string[], options: SpawnOptions = {}) {
     this.#commands = commands
@@ -18,15 +19,19 @@ export class HttpProcessManager {
     this.#options = options
     this.#handler = new MessageHandler()
 
-    this.#handler.on('HTTP_STARTUP', (data: { port: number }) => {
+    this.#handler.on('HTTP_STARTUP', (data: { port: number | null; socket: string | null }) => {
       this.#httpPort = data.port
+      this.#httpSocket = data.socket
     })
   }
 
   async start() {
-    const { process, httpPort } = await startProcess(this.#commands, this.#args, this.#options)
+    const { process, httpPort, httpSocket } = await startProcess(this.#commands, this.#args, this.#options)
 
-    if (httpPort) {
+    if (httpSocket) {
+      this.#httpSocket = httpSocket
+      console.log(`HttpProcessManager: HTTP server ready on socket ${this.#httpSocket}`)
+    } else if (httpPort) {
       this.#httpPort = httpPort
       console.log(`HttpProcessManager: HTTP server ready on port ${this.#httpPort}`)
     }
@@ -41,9 +46,14 @@ export class HttpProcessManager {
     await stopProcess(this.#process)
     this.#process = null
     this.#httpPort = null
+    this.#httpSocket = null
   }
 
   getHttpPort(): number | null {
     return this.#httpPort
   }
+
+  getHttpSocket(): string | null {
+    return this.#httpSocket
+  }
 }
@@ -5,6 +5,7 @@ const STARTUP_FRAMES = ['STARTUP', 'HTTP_STARTUP', 'ERROR']
 interface StartResult {
   process: ChildProcess
   httpPort: number | null
+  httpSocket: string | null
 }
 
 export async function startProcess(
@@ -34,6 +35,7 @@ function trySpawnProcess(command: string, args: string[], options: SpawnOptions)
   return new Promise((resolve, reject) => {
     const process = spawnProcess(command, args, options)
     let httpPort: number | null = null
+    let httpSocket: string | null = null
 
     const timeout = setTimeout(() => {
       cleanup(timeout, process)
@@ -47,7 +49,7 @@ function trySpawnProcess(command: string, args: string[], options: SpawnOptions)
 
     const cleanupAndResolve = () => {
       cleanup(timeout, process)
-      resolve({ process, httpPort })
+      resolve({ process, httpPort, httpSocket })
     }
 
     process.on('error', cleanupAndReject)
@@ -56,6 +58,7 @@ function trySpawnProcess(command: string, args: string[], options: SpawnOptions)
       try {
         const result = processStartupMessage(data)
         if (result.httpPort) httpPort = result.httpPort
+        if (result.httpSocket) httpSocket = result.httpSocket
         if (result.ready) cleanupAndResolve()
       } catch (error) {
         cleanupAndReject(error as Error)
@@ -72,9 +75,10 @@ function spawnProcess(command: string, args: string[], options: SpawnOptions): C
 function processStartupMessage(data: Buffer) {
   console.log(data.toString().trim())
   const messages = parseStartupMessages(data.toString())
-  if (messages.length === 0) return { ready: false, httpPort: null }
+  if (messages.length === 0) return { ready: false, httpPort: null, httpSocket: null }
 
   let httpPort: number | null = null
+  let httpSocket: string | null = null
   let ready = false
 
   for (const message of messages) {
@@ -83,13 +87,18 @@ function processStartupMessage(data: Buffer) {
       console.log(`Startup: Captured HTTP port ${httpPort}`)
     }
 
+    if (message._frame === 'HTTP_STARTUP' && message.socket) {
+      httpSocket = message.socket
+      console.log(`Startup: Captured HTTP socket ${httpSocket}`)
+    }
+
     if (message._frame === 'STARTUP' || message.type === 'startup') {
       ready = true
       console.log('Startup: Backend ready signal received')
     }
   }
 
-  return { ready, httpPort }
+  return { ready, httpPort, httpSocket }
 }
 
 function parseStartupMessages(data: string) {
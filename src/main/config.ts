@@ -1,3 +1,5 @@
+import fs from 'fs'
+import os from 'os'
 import path from 'path'
 import { fileURLToPath } from 'url'
 
@@ -20,6 +22,9 @@ export const statusUrl = fetchStatusUrl()
 export const preloadPath = fetchPreloadPath()
 export const pythonPath = fetchPythonPath()
 
+/* Unix domain socket the Python backend serves its HTTP API on (null where unsupported) */
+export const backendSocketPath = fetchBackendSocketPath()
+
 /* Determine the current environment */
 function fetchEnvironment(): Environment {
   if (app.isPackaged) return Environment.PROD
@@ -62,3 +67,11 @@ function fetchPythonPath(): string {
 
   return isDev ? devPath : prodPath
 }
+
+/* Get a socket path inside a fresh, user-only temp directory (TCP is used on Windows) */
+function fetchBackendSocketPath(): string | null {
+  if (process.platform === 'win32') return null
+
+  const socketDir = fs.mkdtempSync(path.join(os.tmpdir(), 'meshbrowser-'))
+  return path.join(socketDir, 'backend.sock')
+}
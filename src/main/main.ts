@@ -1,5 +1,9 @@
+import fs from 'fs'
+import path from 'path'
+
 import { app, BrowserWindow } from 'electron'
 
+import { backendSocketPath } from './config'
 import { pythonManager } from './processes'
 import { registerProtocolSchemes, setupProtocolHandlers } from '@protocol-handlers/protocol-schemes'
 import { createMainWindow } from './windows'
@@ -42,6 +46,7 @@ async function startReticulumBackend() {
 async function stopReticulumBackend() {
   try {
     await pythonManager.stop()
+    if (backendSocketPath) fs.rmSync(path.dirname(backendSocketPath), { recursive: true, force: true })
     console.log('Reticulum backend stopped successfully')
   } catch (error) {
     console.error('Failed to stop Reticulum backend:', error)
@@ -1,5 +1,7 @@
 import { HttpProcessManager } from '@http-process/manager'
 
-import { pythonPath } from './config'
+import { backendSocketPath, pythonPath } from './config'
 
-export const pythonManager = new HttpProcessManager(['python', 'python3'], [pythonPath])
+const socketArgs = backendSocketPath ? ['--socket', backendSocketPath] : []
+
+export const pythonManager = new HttpProcessManager(['python', 'python3'], [pythonPath, ...socketArgs])
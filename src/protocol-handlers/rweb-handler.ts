@@ -1,11 +1,16 @@
+import http, { IncomingHttpHeaders } from 'http'
 import { protocol } from 'electron'
 import dedent from 'dedent'
 
 import { pythonManager } from '@main/processes'
 
+const PROXY_PATH = '/proxy/reticulum'
+const NULL_BODY_STATUSES = [101, 204, 205, 304]
+
 export function setupRwebHandler() {
+  const httpSocket = pythonManager.getHttpSocket()
   const httpPort = pythonManager.getHttpPort()
-  const backendUrl = `http://localhost:${httpPort}/proxy/reticulum`
+  const backendUrl = `http://localhost:${httpPort}${PROXY_PATH}`
 
   protocol.handle('rweb', handleRequest)
 
@@ -21,15 +26,19 @@ export function setupRwebHandler() {
   }
 
   async function fetchFromBackend(url: URL): Promise<Response> {
-    const response = await fetch(backendUrl, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        method: 'GET',
-        url: url.href.substring(7)
-      })
+    const body = JSON.stringify({
+      method: 'GET',
+      url: url.href.substring(7)
     })
 
+    const response = httpSocket
+      ? await postOverSocket(httpSocket, body)
+      : await fetch(backendUrl, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body
+        })
+
     const isBackendError = response.headers.get('X-Backend-Error') === 'true'
     if (isBackendError) {
       const errorData = await response.json().catch(() => ({}))
@@ -39,6 +48,42 @@ export function setupRwebHandler() {
     return response
   }
 
+  /* fetch() cannot reach a Unix domain socket, so speak HTTP to it with node's http module */
+  function postOverSocket(socketPath: string, body: string): Promise<Response> {
+    return new Promise((resolve, reject) => {
+      const request = http.request(
+        {
+          socketPath,
+          path: PROXY_PATH,
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(body) }
+        },
+        incoming => {
+          const chunks: Buffer[] = []
+          incoming.on('data', (chunk: Buffer) => chunks.push(chunk))
+          incoming.on('error', reject)
+          incoming.on('end', () => {
+            const status = incoming.statusCode ?? 500
+            const content = NULL_BODY_STATUSES.includes(status) ? null : new Uint8Array(Buffer.concat(chunks))
+            resolve(new Response(content, { status, headers: toHeaders(incoming.headers) }))
+          })
+        }
+      )
+
+      request.on('error', reject)
+      request.end(body)
+    })
+  }
+
+  function toHeaders(incomingHeaders: IncomingHttpHeaders): Headers {
+    const headers = new Headers()
+    for (const [name, value] of Object.entries(incomingHeaders)) {
+      if (value === undefined) continue
+      for (const item of Array.isArray(value) ? value : [value]) headers.append(name, item)
+    }
+    return headers
+  }
+
   function createErrorResponse(request: Request, error: Error): Response {
     console.error('Protocol handler error:', error)
 
@@ -4,13 +4,37 @@ Message Sender - Structured communication with Electron
 
 Provides consistent framed JSON messaging for all Python backend components.
 Can be used by console server, HTTP server, protocol handlers, etc.
+
+Messages are queued and written by a single writer thread per output stream,
+so logging never blocks the calling thread on a slow pipe and frames from
+concurrent threads never interleave.
 """
 
+import atexit
 import json
+import os
+import queue
 import sys
+import threading
+import time
 from typing import Dict, Any, TextIO
 
 
+# Log frames in ascending severity; anything else (STARTUP, HTTP_STARTUP...) is a lifecycle frame
+LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+
+# Writer queue limits
+QUEUE_SIZE = 1024
+BATCH_SIZE = 256
+EXIT_FLUSH_TIMEOUT = 2  # seconds
+PRIORITY_PUT_TIMEOUT = 0.5  # seconds an ERROR or lifecycle frame may wait for queue space
+
+_min_level = LEVELS.get(os.environ.get('MESHBROWSER_LOG_LEVEL', 'INFO').upper(), LEVELS['INFO'])
+
+_writers: Dict[int, '_FrameWriter'] = {}
+_writers_lock = threading.Lock()
+
+
 class ConsoleMessageSender:
     """Handles structured JSON messaging with frame prefixes"""
 
@@ -18,6 +42,29 @@ class ConsoleMessageSender:
         """Initialize with output stream (defaults to stdout)"""
 
         self.output_stream = output_stream or sys.stdout
+        self._writer = _writer_for(self.output_stream)
+
+
+    @staticmethod
+    def set_level(level: str):
+        """Set the minimum log level (DEBUG, INFO, WARNING, ERROR) for all senders"""
+
+        global _min_level
+        _min_level = LEVELS[level.upper()]
+
+
+    @staticmethod
+    def is_enabled(level: str) -> bool:
+        """Check whether a log level would be sent, to skip building costly messages"""
+
+        return LEVELS[level.upper()] >= _min_level
+
+
+    @property
+    def dropped(self) -> int:
+        """Number of messages dropped because the output queue was full"""
+
+        return self._writer.dropped
 
 
     def send_error(self, error: str, **extra_data):
@@ -34,6 +81,9 @@ class ConsoleMessageSender:
 
     def send_warning(self, warning: str, **extra_data):
         """Send WARNING frame message"""
+        if LEVELS['WARNING'] < _min_level:
+            return
+
         warning_data = {
             'type': 'warning',
             'message': warning,
@@ -45,6 +95,8 @@ class ConsoleMessageSender:
 
     def send_info(self, info: str, **extra_data):
         """Send INFO frame message"""
+        if LEVELS['INFO'] < _min_level:
+            return
 
         info_data = {
             'type': 'info',
@@ -57,6 +109,8 @@ class ConsoleMessageSender:
 
     def send_debug(self, debug: str, **extra_data):
         """Send DEBUG frame message"""
+        if LEVELS['DEBUG'] < _min_level:
+            return
 
         debug_data = {
             'type': 'debug',
@@ -68,9 +122,111 @@ class ConsoleMessageSender:
 
 
     def send_message(self, frame: str, message: Dict[str, Any]):
-        """Send framed JSON message to output stream"""
-
-        json_str = json.dumps(message)
-        framed_message = f"{frame}: {json_str}\n"
-        self.output_stream.write(framed_message)
+        """Queue framed JSON message for the output stream"""
+
+        self._writer.put(frame, message)
+
+
+    def flush(self, timeout: float = None):
+        """Wait until every queued message has been written"""
+
+        self._writer.flush(timeout)
+
+
+class _FrameWriter:
+    """Single writer thread that batches queued frames onto one output stream"""
+
+    def __init__(self, output_stream: TextIO):
+        self.output_stream = output_stream
+        self.dropped = 0
+        self._unreported = 0
+        self._queue = queue.Queue(QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='ConsoleWriter', daemon=True)
+        self._thread.start()
+
+    def put(self, frame: str, message: Dict[str, Any]):
+        """Queue a frame, dropping it rather than stalling the caller when the queue is full"""
+
+        try:
+            if frame in LEVELS and frame != 'ERROR':
+                self._queue.put_nowait((frame, message))
+            else:
+                # Errors and lifecycle frames (STARTUP, HTTP_STARTUP...) get a short wait for
+                # space before being dropped, so a stalled pipe can only delay callers briefly
+                self._queue.put((frame, message), timeout=PRIORITY_PUT_TIMEOUT)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+
+    def flush(self, timeout: float = None):
+        """Wait for the queue to drain"""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks and self._thread.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+
+    def _run(self):
+        """Drain the queue, writing each batch with a single write and flush"""
+
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except (OSError, ValueError):
+                # Electron closed the pipe (or a message could not be serialized)
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch):
+        """Serialize a batch, plus a notice of any drops, into a single write"""
+
+        lines = [self._format(frame, message) for frame, message in batch]
+
+        with self._lock:
+            unreported, self._unreported = self._unreported, 0
+        if unreported:
+            lines.append(self._format('WARNING', {
+                'type': 'warning',
+                'message': f'Dropped {unreported} console messages (output queue full)',
+                'dropped': unreported
+            }))
+
+        self.output_stream.write(''.join(lines))
         self.output_stream.flush()
+
+    @staticmethod
+    def _format(frame: str, message: Dict[str, Any]) -> str:
+        """Serialize a message into its framed line"""
+
+        return f"{frame}: {json.dumps(message, default=str)}\n"
+
+
+def _writer_for(output_stream: TextIO) -> _FrameWriter:
+    """Get the shared writer for an output stream, creating it on first use"""
+
+    with _writers_lock:
+        writer = _writers.get(id(output_stream))
+        if writer is None:
+            writer = _FrameWriter(output_stream)
+            _writers[id(output_stream)] = writer
+        return writer
+
+
+@atexit.register
+def _flush_all():
+    """Write out anything still queued before the interpreter exits"""
+
+    for writer in list(_writers.values()):
+        writer.flush(EXIT_FLUSH_TIMEOUT)
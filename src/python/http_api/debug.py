@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Live Diagnostics for the /api/debug/ endpoints
+
+Thread stack dumps, a sampling profiler producing collapsed stacks for
+flamegraphs, and tracemalloc snapshot diffs. Nothing here runs until an
+endpoint is called, and the endpoints only exist when the debug API is enabled.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from collections import Counter
+from typing import Dict, Any
+
+
+# Profiler limits
+MAX_PROFILE_SECONDS = 60
+DEFAULT_SAMPLE_INTERVAL = 0.005  # seconds
+MIN_SAMPLE_INTERVAL = 0.001  # seconds
+
+_profile_lock = threading.Lock()
+
+
+def dump_threads() -> str:
+    """Format the current stack of every thread, oldest frame first"""
+
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    sections = []
+
+    for thread_id, frame in sys._current_frames().items():
+        name = names.get(thread_id, 'unknown')
+        stack = ''.join(traceback.format_stack(frame))
+        sections.append(f'Thread {name} ({thread_id}):\n{stack}')
+
+    return '\n'.join(sections)
+
+
+def sample_profile(seconds: float, interval: float = DEFAULT_SAMPLE_INTERVAL) -> str:
+    """
+    Sample every thread's stack for a number of seconds
+
+    Runs on the calling thread, which is left out of the samples.
+
+    Returns:
+        Collapsed stacks ('thread;frame;frame count' per line) for flamegraph tools
+    """
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise ValueError(f'seconds must be between 0 and {MAX_PROFILE_SECONDS}')
+    if not 0 < interval <= seconds:
+        raise ValueError('interval must be greater than 0 and no longer than seconds')
+    interval = max(interval, MIN_SAMPLE_INTERVAL)
+
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError('A profile is already running')
+
+    try:
+        own_id = threading.get_ident()
+        stacks = Counter()
+        deadline = time.monotonic() + seconds
+
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    stacks[_collapse(names.get(thread_id, 'unknown'), frame)] += 1
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+    finally:
+        _profile_lock.release()
+
+    return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+def _collapse(thread_name: str, frame) -> str:
+    """Collapse a frame chain into a root-first, semicolon separated stack"""
+
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+        frame = frame.f_back
+
+    frames.append(thread_name)
+    return ';'.join(reversed(frames))
+
+
+class MemoryTracker:
+    """Starts and stops tracemalloc and diffs each snapshot against the previous one"""
+
+    def __init__(self):
+        self._previous = None
+        self._lock = threading.Lock()
+
+    def start(self, frames: int = 1) -> Dict[str, Any]:
+        """Start tracing allocations, keeping the given number of frames per trace"""
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            self._previous = None
+            return self._status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop tracing and release all trace data"""
+
+        with self._lock:
+            tracemalloc.stop()
+            self._previous = None
+            return self._status()
+
+    def snapshot(self, limit: int = 25) -> Dict[str, Any]:
+        """Take a snapshot, returning top allocations and the change since the last snapshot"""
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                raise RuntimeError('tracemalloc is not running')
+
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+            ])
+            previous, self._previous = self._previous, snapshot
+
+            result = self._status()
+            result['top'] = [_stat(stat) for stat in snapshot.statistics('lineno')[:limit]]
+            if previous is not None:
+                result['diff'] = [_stat(stat) for stat in snapshot.compare_to(previous, 'lineno')[:limit]]
+            return result
+
+    @staticmethod
+    def _status() -> Dict[str, Any]:
+        """Report whether tracing is on and how much memory it has seen"""
+
+        current, peak = tracemalloc.get_traced_memory()
+        return {'tracing': tracemalloc.is_tracing(), 'current_bytes': current, 'peak_bytes': peak}
+
+
+def _stat(stat) -> Dict[str, Any]:
+    """Serialize a tracemalloc Statistic or StatisticDiff"""
+
+    frame = stat.traceback[0]
+    data = {'location': f'{frame.filename}:{frame.lineno}', 'size': stat.size, 'count': stat.count}
+    if hasattr(stat, 'size_diff'):
+        data['size_diff'] = stat.size_diff
+        data['count_diff'] = stat.count_diff
+    return data
+
+
+memory_tracker = MemoryTracker()
@@ -9,26 +9,37 @@ with the Reticulum network through the ReticulumHandler.
 import base64
 import json
 import sys
+import time
 from http.server import BaseHTTPRequestHandler
 from typing import Dict, Any
+from urllib.parse import urlsplit, parse_qs
 
+import console as Console
 import reticulum as Reticulum
+from . import debug
 
 
 
 class HTTP_API_Handler(BaseHTTPRequestHandler):
     """HTTP request handler for Reticulum proxy requests"""
 
-    def __init__(self, reticulum_client, *args, **kwargs):
+    def __init__(self, reticulum_client, *args, debug_api: bool = False, **kwargs):
         # Use shared ReticulumClient instance (created in main thread)
         self.reticulum_client = reticulum_client
+        self.debug_api = debug_api
+        self.messenger = Console.MessageSender()
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
         """Handle GET requests"""
         try:
-            if self.path == '/api/status':
+            url = urlsplit(self.path)
+            if url.path == '/api/status':
                 self._handle_status_request()
+            elif url.path == '/api/servers':
+                self._handle_servers_request(parse_qs(url.query))
+            elif self.debug_api and url.path.startswith('/api/debug/'):
+                self._handle_debug_request('GET', url)
             else:
                 self._send_error(404, "Not Found")
         except Exception as e:
@@ -37,9 +48,11 @@ class HTTP_API_Handler(BaseHTTPRequestHandler):
     def do_POST(self):
         """Handle POST requests to /proxy/reticulum endpoint"""
         try:
-            # Only handle /proxy/reticulum endpoint
-            if self.path == '/proxy/reticulum':
+            url = urlsplit(self.path)
+            if url.path == '/proxy/reticulum':
                 self._handle_reticulum_proxy()
+            elif self.debug_api and url.path.startswith('/api/debug/'):
+                self._handle_debug_request('POST', url)
             else:
                 self._send_error(404, "Not Found")
         except Exception as e:
@@ -49,17 +62,45 @@ class HTTP_API_Handler(BaseHTTPRequestHandler):
         """Handle status requests"""
         try:
             status_data = self.reticulum_client.get_status()
-            status_json = json.dumps(status_data)
-
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(status_json)))
-            self.end_headers()
-
-            self.wfile.write(status_json.encode('utf-8'))
+            self._send_json(status_data)
         except Exception as e:
             self._send_error(500, f"Failed to get status: {str(e)}")
 
+    def _handle_servers_request(self, query: Dict[str, Any]):
+        """Handle discovered server listing and search requests"""
+        try:
+            search = query.get('q', [None])[0]
+            self._send_json({'servers': self.reticulum_client.get_servers(search)})
+        except Exception as e:
+            self._send_error(500, f"Failed to get servers: {str(e)}")
+
+    def _handle_debug_request(self, method: str, url):
+        """Handle diagnostics requests (only routed when the debug API is enabled)"""
+        query = parse_qs(url.query)
+        route = (method, url.path[len('/api/debug/'):])
+
+        try:
+            if route == ('GET', 'threads'):
+                self._send_text(debug.dump_threads())
+            elif route == ('GET', 'profile'):
+                seconds = float(query.get('seconds', ['10'])[0])
+                interval = float(query.get('interval', [debug.DEFAULT_SAMPLE_INTERVAL])[0])
+                self._send_text(debug.sample_profile(seconds, interval))
+            elif route == ('POST', 'memory/start'):
+                frames = int(query.get('frames', ['1'])[0])
+                self._send_json(debug.memory_tracker.start(frames))
+            elif route == ('POST', 'memory/stop'):
+                self._send_json(debug.memory_tracker.stop())
+            elif route == ('GET', 'memory/snapshot'):
+                limit = int(query.get('limit', ['25'])[0])
+                self._send_json(debug.memory_tracker.snapshot(limit))
+            else:
+                self._send_error(404, "Not Found")
+        except ValueError as e:
+            self._send_error(400, str(e))
+        except RuntimeError as e:
+            self._send_error(409, str(e))
+
     def _handle_reticulum_proxy(self):
         """Handle proxy requests to Reticulum network"""
         # Read request body
@@ -89,14 +130,42 @@ class HTTP_API_Handler(BaseHTTPRequestHandler):
             return
 
         try:
-            # Call Reticulum client directly
-            result = self.reticulum_client.fetch_page(url)
+            start_time = time.monotonic()
+
+            # Serve from a mounted site pack when mirrored, otherwise go to the network
+            result = self.reticulum_client.fetch_mirrored(url)
+            source = 'mirror' if result else 'network'
+            if not result:
+                result = self.reticulum_client.fetch_page(url)
             self._send_reticulum_response(result)
+
+            if self.messenger.is_enabled('DEBUG'):
+                elapsed_ms = round((time.monotonic() - start_time) * 1000)
+                self.messenger.send_debug(f"Fetched {url} from {source} in {elapsed_ms}ms",
+                                          url=url, source=source, status_code=result.get('status_code'),
+                                          elapsed_ms=elapsed_ms)
         except (RuntimeError, ValueError, ConnectionError, TimeoutError) as e:
             self._send_error(500, str(e))
         except Exception as e:
             self._send_error(500, f'Unexpected error: {str(e)}')
 
+    def _send_json(self, data: Dict[str, Any]):
+        """Send JSON response"""
+        self._send_body('application/json', json.dumps(data).encode('utf-8'))
+
+    def _send_text(self, text: str):
+        """Send plain text response"""
+        self._send_body('text/plain; charset=utf-8', text.encode('utf-8'))
+
+    def _send_body(self, content_type: str, body: bytes):
+        """Send a successful response with the given body"""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        self.wfile.write(body)
+
     def _send_error(self, code: int, message: str):
         """Send error response"""
         error_data = {'error': message}
@@ -6,7 +6,8 @@ Manages the HTTP server lifecycle and coordinates with the HTTP request handler.
 Uses only Python standard library - no external dependencies.
 """
 
-import socket
+import os
+import socketserver
 from http.server import ThreadingHTTPServer
 from threading import Thread
 
@@ -17,33 +18,42 @@ from .handler import HTTP_API_Handler
 class HTTP_API_Server:
     """HTTP server that handles Reticulum proxy requests"""
 
-    def __init__(self, reticulum_client):
+    def __init__(self, reticulum_client, debug_api: bool = False, socket_path: str = None):
         self.messenger = Console.MessageSender()
         self.reticulum_client = reticulum_client
+        self.debug_api = debug_api
         self.server = None
         self.server_thread = None
         self.port = None
+        self.socket_path = socket_path if unix_sockets_supported() else None
 
     def start(self):
-        """Start HTTP server on available port"""
-        # Find available port
-        self.port = self._find_available_port()
+        """Start HTTP server on the Unix socket if one was requested, else on an available port"""
 
         # Create handler factory that passes shared client to each handler instance
         def handler_factory(*args, **kwargs):
-            return HTTP_API_Handler(self.reticulum_client, *args, **kwargs)
+            return HTTP_API_Handler(self.reticulum_client, *args, debug_api=self.debug_api, **kwargs)
 
         # Create server with HTTP handler factory
-        self.server = ThreadingHTTPServer(('localhost', self.port), handler_factory)
+        if self.socket_path:
+            self.server = ThreadingUnixHTTPServer(self.socket_path, handler_factory)
+        else:
+            # Binding port 0 lets the OS pick a free port with no bind/close/rebind race
+            self.server = ThreadingHTTPServer(('localhost', 0), handler_factory)
+            self.port = self.server.server_address[1]
 
         # Start server in background thread
         self.server_thread = Thread(target=self.server.serve_forever, daemon=True)
         self.server_thread.start()
 
+        if self.debug_api:
+            self.messenger.send_warning('Debug API enabled at /api/debug/')
+
         # Send startup message via structured messaging
         self.messenger.send_message('HTTP_STARTUP', {
             'port': self.port,
-            'message': f'HTTP server started on port {self.port}'
+            'socket': self.socket_path,
+            'message': f'HTTP server started on {self._describe_address()}'
         })
 
 
@@ -54,16 +64,38 @@ class HTTP_API_Server:
             self.server.server_close()
             self.messenger.send_message('HTTP_SHUTDOWN', {
                 'port': self.port,
+                'socket': self.socket_path,
                 'message': 'HTTP server stopped'
             })
 
 
-    def _find_available_port(self) -> int:
-        """Find an available port for the server"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            sock.bind(('localhost', 0))
-            port = sock.getsockname()[1]
-            return port
-        finally:
-            sock.close()
+    def _describe_address(self) -> str:
+        """Human readable listening address for lifecycle messages"""
+        if self.socket_path:
+            return f'socket {self.socket_path}'
+        return f'port {self.port}'
+
+
+def unix_sockets_supported() -> bool:
+    """Check whether this platform can serve HTTP over a Unix domain socket"""
+    return hasattr(socketserver, 'ThreadingUnixStreamServer')
+
+
+if unix_sockets_supported():
+    class ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+        """Threaded HTTP server listening on a Unix domain socket"""
+
+        daemon_threads = True
+
+        def server_bind(self):
+            """Replace any stale socket file, bind, and restrict access to this user"""
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+            super().server_bind()
+            os.chmod(self.server_address, 0o600)
+
+        def server_close(self):
+            """Close the socket and remove its file"""
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
@@ -5,7 +5,9 @@ MeshBrowser Python Backend - Main Entry Point
 Sets up the backend service with command routing and handlers.
 """
 
+import argparse
 import json
+import os
 import sys
 
 import console as Console
@@ -16,6 +18,8 @@ import reticulum as Reticulum
 def main():
     """Initialize and run the backend service"""
 
+    args = _parse_args()
+
     # Initialize structured messaging
     messenger = Console.MessageSender()
 
@@ -26,8 +30,22 @@ def main():
         messenger.send_error(f"Failed to initialize Reticulum client: {e}")
         return
 
+    try:
+        # Mirroring mode crawls a site into its pack file and exits
+        if args.mirror:
+            _mirror_site(reticulum_client, messenger, args.mirror)
+        else:
+            _serve(reticulum_client, messenger, args.socket)
+    finally:
+        reticulum_client.stop()
+
+
+def _serve(reticulum_client, messenger, socket_path):
+    """Run the HTTP server until Electron closes stdin"""
+
     # Start the HTTP server with shared client
-    http_server = HTTP.Server(reticulum_client)
+    debug_api = os.environ.get('MESHBROWSER_DEBUG_API') == '1'
+    http_server = HTTP.Server(reticulum_client, debug_api=debug_api, socket_path=socket_path)
     try:
         http_server.start()
     except Exception as e:
@@ -43,5 +61,34 @@ def main():
         http_server.stop()
 
 
+def _parse_args():
+    """Parse command line arguments"""
+
+    parser = argparse.ArgumentParser(description='MeshBrowser Python backend')
+    parser.add_argument('--mirror', metavar='URL',
+                        help='mirror a site (hash or hash/path) for offline browsing, then exit')
+    parser.add_argument('--socket', metavar='PATH',
+                        help='serve the HTTP API on this Unix domain socket instead of a TCP port')
+    return parser.parse_args()
+
+
+def _mirror_site(reticulum_client, messenger, url):
+    """Crawl a site into its pack file, reporting progress as INFO frames"""
+
+    def on_progress(path, outcome):
+        messenger.send_info(f"{outcome}: {path}", path=path, outcome=outcome)
+
+    try:
+        summary = reticulum_client.mirror_site(url, on_progress=on_progress)
+    except Exception as e:
+        messenger.send_error(f"Failed to mirror {url}: {e}")
+        return
+
+    messenger.send_info(
+        f"Mirrored {summary['entries']} entries ({summary['appended']} changed) into {summary['pack']}",
+        **summary
+    )
+
+
 if __name__ == '__main__':
     main()
@@ -11,6 +11,10 @@ Structure:
 - fetch.py: Content fetching (application layer)
 - response.py: HTTP response parsing
 - status.py: Status information gathering
+- discovery.py: Announce-driven server index and path warming
+- mirror.py: Offline site mirroring and serving from mounted packs
+- pack.py: Append-only site pack file format
+- storage.py: Local data directory locations
 """
 
 from .client import ReticulumClient
@@ -6,13 +6,15 @@ Provides a simple interface that delegates to focused utility modules.
 """
 
 import RNS
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 
 from .url import parse_url
 from .link import establish_link
 from .fetch import fetch
 from .response import parse_response
 from .status import get_status
+from .mirror import MirrorStore, mirror_site
+from .discovery import ServerIndex, ServerAnnounceHandler, PathWarmer
 
 
 class ReticulumClient:
@@ -21,6 +23,17 @@ class ReticulumClient:
     def __init__(self):
         """Initialize Reticulum networking"""
         self.reticulum = RNS.Reticulum()
+        self.mirrors = MirrorStore()
+
+        # Discover rserver/web servers from announces and keep their paths warm
+        self.servers = ServerIndex()
+        RNS.Transport.register_announce_handler(ServerAnnounceHandler(self.servers))
+        self.path_warmer = PathWarmer(self.servers)
+        self.path_warmer.start()
+
+    def stop(self):
+        """Stop background work and persist the server index"""
+        self.path_warmer.stop()
 
     def fetch_page(self, url: str) -> Dict[str, Any]:
         """Fetch content from a Reticulum destination"""
@@ -41,6 +54,21 @@ class ReticulumClient:
             # Always clean up the link
             link.teardown()
 
+    def fetch_mirrored(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch content from a mounted site pack, or None if it was never mirrored"""
+
+        return self.mirrors.lookup(url)
+
+    def mirror_site(self, url: str, on_progress: Callable[[str, str], None] = None) -> Dict[str, Any]:
+        """Crawl a destination into its site pack for offline browsing"""
+
+        return mirror_site(self.fetch_page, url, on_progress=on_progress)
+
+    def get_servers(self, query: str = None) -> List[Dict[str, Any]]:
+        """List servers discovered from announces, optionally filtered by hash or name"""
+
+        return self.servers.servers(query)
+
     def get_status(self) -> Dict[str, Any]:
         """Get current Reticulum status and system information"""
 
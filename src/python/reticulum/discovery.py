@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Server Discovery
+
+Listens for rserver/web announces, keeps an index of known servers that
+survives restarts, and keeps paths warm to recently announced servers so the
+first fetch does not have to wait on path discovery.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import RNS
+
+from .storage import data_path
+
+
+# Announces older than this are dropped from the index
+ANNOUNCE_TTL = 24 * 60 * 60  # seconds
+
+# Servers announced within this window have their paths kept warm
+WARM_WINDOW = 30 * 60  # seconds
+WARM_INTERVAL = 60  # seconds
+STOP_TIMEOUT = 5  # seconds
+
+
+class ServerIndex:
+    """Thread-safe, persisted index of announced servers"""
+
+    def __init__(self, path: str = None):
+        self.path = path or data_path('servers.json')
+        self._servers: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def record(self, dest_hash: bytes, app_data: Optional[bytes], hops: int):
+        """Add or refresh a server from an announce"""
+
+        entry = {
+            'hash': dest_hash.hex(),
+            'name': _decode_name(app_data),
+            'app_data': app_data.hex() if app_data else None,
+            'hops': hops,
+            'last_seen': time.time()
+        }
+
+        with self._lock:
+            self._servers[entry['hash']] = entry
+            self._dirty = True
+
+    def servers(self, query: str = None) -> List[Dict[str, Any]]:
+        """List live servers, most recently seen first, optionally filtered by hash or name"""
+
+        self.expire()
+        query = query.lower() if query else None
+
+        with self._lock:
+            servers = [dict(entry) for entry in self._servers.values()]
+
+        if query:
+            servers = [entry for entry in servers if _matches(entry, query)]
+
+        return sorted(servers, key=lambda entry: entry['last_seen'], reverse=True)
+
+    def recent(self, window: float) -> List[bytes]:
+        """Hashes of servers announced within the last window seconds"""
+
+        cutoff = time.time() - window
+        with self._lock:
+            return [bytes.fromhex(entry['hash']) for entry in self._servers.values() if entry['last_seen'] >= cutoff]
+
+    def expire(self):
+        """Drop servers whose last announce is older than the TTL"""
+
+        cutoff = time.time() - ANNOUNCE_TTL
+        with self._lock:
+            expired = [key for key, entry in self._servers.items() if entry['last_seen'] < cutoff]
+            for key in expired:
+                del self._servers[key]
+            if expired:
+                self._dirty = True
+
+    def save(self):
+        """Persist the index if it changed since the last save"""
+
+        # Serialize savers so concurrent calls never share the temp file
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = json.dumps(list(self._servers.values()))
+                self._dirty = False
+
+            # Write then rename so a crash never leaves a half-written index
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w') as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+
+    def _load(self):
+        """Load the persisted index, ignoring a missing or corrupt file"""
+
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(entries, list):
+            return
+
+        for entry in entries:
+            if _is_valid_entry(entry):
+                self._servers[entry['hash']] = entry
+
+        self.expire()
+
+
+class ServerAnnounceHandler:
+    """RNS announce handler feeding rserver/web announces into a ServerIndex"""
+
+    aspect_filter = 'rserver.web'
+
+    # Path responses are replayed from cached announces (including ones our own path
+    # requests trigger), so only real announces may refresh last_seen
+    receive_path_responses = False
+
+    def __init__(self, index: ServerIndex):
+        self.index = index
+
+    def received_announce(self, destination_hash, announced_identity, app_data):
+        """Called by RNS.Transport for every matching announce"""
+
+        self.index.record(destination_hash, app_data, RNS.Transport.hops_to(destination_hash))
+
+
+class PathWarmer:
+    """Background thread that requests paths to recently announced servers and saves the index"""
+
+    def __init__(self, index: ServerIndex):
+        self.index = index
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start warming paths in a daemon thread"""
+
+        self._thread = threading.Thread(target=self._run, name='PathWarmer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop warming and save the index one last time"""
+
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(STOP_TIMEOUT)
+        self.index.save()
+
+    def _run(self):
+        """Warm paths and persist the index every interval"""
+
+        while not self._stop_event.wait(WARM_INTERVAL):
+            try:
+                self.index.expire()
+                self._warm_paths()
+                self.index.save()
+            except Exception as e:
+                RNS.log(f'Path warming failed: {e}', RNS.LOG_WARNING)
+
+    def _warm_paths(self):
+        """Request paths that have lapsed for recently announced servers"""
+
+        for dest_hash in self.index.recent(WARM_WINDOW):
+            if not RNS.Transport.has_path(dest_hash):
+                RNS.Transport.request_path(dest_hash)
+
+
+def _is_valid_entry(entry: Any) -> bool:
+    """Check that a persisted entry has the fields the index relies on"""
+
+    if not isinstance(entry, dict) or not isinstance(entry.get('hash'), str):
+        return False
+
+    last_seen = entry.get('last_seen')
+    if not isinstance(last_seen, (int, float)) or isinstance(last_seen, bool):
+        return False
+
+    try:
+        bytes.fromhex(entry['hash'])
+    except ValueError:
+        return False
+
+    return entry.get('name') is None or isinstance(entry.get('name'), str)
+
+
+def _decode_name(app_data: Optional[bytes]) -> Optional[str]:
+    """Interpret announce app data as a display name when it is printable text"""
+
+    if not app_data:
+        return None
+
+    try:
+        name = app_data.decode('utf-8').strip()
+    except UnicodeDecodeError:
+        return None
+
+    return name if name.isprintable() else None
+
+
+def _matches(entry: Dict[str, Any], query: str) -> bool:
+    """Check whether an entry's hash or name contains the query"""
+
+    return query in entry['hash'] or query in (entry.get('name') or '').lower()
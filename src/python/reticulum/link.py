@@ -26,6 +26,10 @@ def establish_link(dest_hash: bytes, app: str, *aspects) -> RNS.Link:
 def _request_path(dest_hash: bytes) -> None:
     """Request path to destination"""
 
+    # Paths learned from announces (or kept warm by discovery) need no round trip
+    if RNS.Transport.has_path(dest_hash):
+        return
+
     RNS.Transport.request_path(dest_hash)
     _wait_for_path(dest_hash)
 
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Offline Site Mirroring
+
+Crawls a destination's same-origin links into a site pack so it can later be
+browsed without any mesh traffic, and serves mirrored responses back out of
+the mounted packs.
+"""
+
+import base64
+import os
+import re
+import threading
+from collections import deque
+from html.parser import HTMLParser
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from .pack import SitePack, PackWriter
+from .storage import data_path
+from .url import parse_url
+
+
+# Crawl limits
+MAX_PAGES = 1000
+
+# Only these responses are scanned for further links
+CRAWLABLE_TYPES = ('text/html', 'text/css')
+
+CSS_URL_PATTERN = re.compile(r'''url\(\s*['"]?([^'")\s]+)['"]?\s*\)|@import\s+['"]([^'"]+)['"]''')
+
+
+def pack_path(dest_hash: bytes) -> str:
+    """Location of the pack file for a destination"""
+
+    return data_path('mirrors', f'{dest_hash.hex()}.pack')
+
+
+def mirror_site(fetch_page: Callable[[str], Dict[str, Any]], url: str,
+                max_pages: int = MAX_PAGES,
+                on_progress: Callable[[str, str], None] = None) -> Dict[str, Any]:
+    """
+    Crawl a destination and write every response into its pack file
+
+    Re-syncing an existing pack only appends entries whose response changed.
+    Pages that fail to fetch keep their previously mirrored copy and are still
+    crawled through it, and if the crawl was incomplete (failures or the page
+    limit) every previously mirrored page it did not reach is carried over.
+
+    Args:
+        fetch_page: Fetches a 'hash/path' URL (ReticulumClient.fetch_page)
+        url: Destination hash, optionally with a start path
+        max_pages: Upper bound on the number of paths fetched
+        on_progress: Called with (path, outcome) after every fetch
+
+    Returns:
+        Dict with sync counts, failures and the pack location
+    """
+    dest_hash, start_path = parse_url(url)
+    origin = dest_hash.hex()
+    path = pack_path(dest_hash)
+
+    previous = SitePack(path)
+    writer = PackWriter(path, previous)
+    failures = []
+
+    queue = deque([start_path])
+    seen = {start_path}
+    fetched = 0
+
+    try:
+        while queue and fetched < max_pages:
+            page_path = queue.popleft()
+            fetched += 1
+
+            try:
+                result = fetch_page(origin + page_path)
+            except Exception as e:
+                failures.append({'path': page_path, 'error': str(e)})
+                kept = previous.get(page_path) if writer.keep(page_path) else None
+                _report(on_progress, page_path, 'kept' if kept else 'failed')
+                if not kept:
+                    continue
+
+                # Keep crawling through the previously mirrored copy
+                body, content_type, status_code = kept.body, kept.content_type, kept.status_code
+            else:
+                body = base64.b64decode(result['content'])
+                content_type = result['content_type']
+                status_code = result['status_code']
+
+                changed = writer.add(page_path, content_type, status_code, body)
+                _report(on_progress, page_path, 'updated' if changed else 'unchanged')
+
+            if status_code == 200 and content_type.split(';')[0].strip() in CRAWLABLE_TYPES:
+                for link in _extract_links(body, content_type, origin, page_path):
+                    if link not in seen:
+                        seen.add(link)
+                        queue.append(link)
+
+        # An incomplete crawl cannot tell removed pages from unreached ones, so keep them all
+        if failures or queue:
+            writer.keep_remaining()
+
+        entries = writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        previous.close()
+
+    return {
+        'destination': origin,
+        'pack': path,
+        'entries': entries,
+        'appended': writer.appended,
+        'unchanged': writer.unchanged,
+        'failures': failures,
+        'truncated': bool(queue)
+    }
+
+
+def _report(on_progress, path: str, outcome: str):
+    """Notify the progress callback, if any"""
+
+    if on_progress:
+        on_progress(path, outcome)
+
+
+def _extract_links(body: bytes, content_type: str, origin: str, page_path: str) -> List[str]:
+    """Find same-origin paths referenced by an HTML or CSS document"""
+
+    text = body.decode('utf-8', errors='replace')
+
+    if content_type.startswith('text/css'):
+        references = [first or second for first, second in CSS_URL_PATTERN.findall(text)]
+    else:
+        parser = _LinkParser()
+        parser.feed(text)
+        references = parser.references
+
+    # Resolve against an http:// base since urljoin does not know rweb://
+    base = f'http://{origin}{page_path}'
+    links = []
+    for reference in references:
+        if reference.startswith('rweb://'):
+            reference = 'http://' + reference[len('rweb://'):]
+
+        resolved = urlsplit(urljoin(base, reference))
+        if resolved.scheme != 'http' or resolved.netloc.lower() != origin:
+            continue
+
+        link = resolved.path or '/'
+        if resolved.query:
+            link += '?' + resolved.query
+        links.append(link)
+
+    return links
+
+
+class _LinkParser(HTMLParser):
+    """Collects href/src references and inline style url()s from HTML"""
+
+    LINK_ATTRIBUTES = ('href', 'src')
+
+    def __init__(self):
+        super().__init__()
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if not value:
+                continue
+            if name in self.LINK_ATTRIBUTES:
+                self.references.append(value)
+            elif name == 'style':
+                self.references.extend(first or second for first, second in CSS_URL_PATTERN.findall(value))
+
+    def handle_data(self, data):
+        if self.lasttag == 'style':
+            self.references.extend(first or second for first, second in CSS_URL_PATTERN.findall(data))
+
+
+class MirrorStore:
+    """Serves responses out of the pack files present in the mirrors directory"""
+
+    def __init__(self):
+        # pack path -> (file size when opened, pack), so unchanged files are never reopened
+        self._packs: Dict[str, Tuple[int, SitePack]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a mirrored response for a URL, or None if it is not mirrored"""
+
+        dest_hash, path = parse_url(url)
+        pack = self._mounted(dest_hash)
+        if not pack:
+            return None
+
+        entry = pack.get(path)
+        if not entry:
+            return None
+
+        return {
+            'content': base64.b64encode(entry.body).decode('ascii'),
+            'content_type': entry.content_type,
+            'status_code': entry.status_code,
+            'encoding': 'base64'
+        }
+
+    def _mounted(self, dest_hash: bytes) -> Optional[SitePack]:
+        """Open (or reopen after a re-sync) the pack for a destination"""
+
+        path = pack_path(dest_hash)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._packs.get(path)
+            if cached is None or cached[0] != size:
+                # Old maps stay valid for readers still holding them; let GC release them.
+                # Mid-sync the pack reopens at its last committed footer and keeps serving.
+                cached = (size, SitePack(path))
+                self._packs[path] = cached
+
+        pack = cached[1]
+        return pack if pack.size else None
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Site Pack Files
+
+Compact, append-only storage for mirrored sites. One pack holds every response
+mirrored from a single destination.
+
+Layout:
+    [record]...[index][footer]  [record]...[index][footer]  ...
+
+- record: RECORD header, then path, content type and body bytes
+- index: fixed-size slots (path key, record offset, record length) sorted by key
+- footer: magic, offset of the latest index and its slot count
+
+Every sync appends its new or changed records followed by a fresh index and
+footer. Readers use the last valid footer, so older indexes and superseded
+records are simply dead space, and a sync that is still running (or was
+killed part way) leaves the previously committed index readable.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+PACK_MAGIC = b'MBPACK01'
+
+# path length, content type length, status code, body length, entry digest
+RECORD = struct.Struct('>HHHI32s')
+
+# path key, record offset, record length
+INDEX_SLOT = struct.Struct('>16sQI')
+
+# magic, index offset, slot count
+FOOTER = struct.Struct('>8sQI')
+
+
+class PackEntry(NamedTuple):
+    """A single mirrored response"""
+    path: str
+    content_type: str
+    status_code: int
+    digest: bytes
+    body: bytes
+
+
+def path_key(path: str) -> bytes:
+    """Hash a request path into its fixed-size index key"""
+
+    return hashlib.blake2b(path.encode('utf-8'), digest_size=16).digest()
+
+
+def entry_digest(content_type: str, status_code: int, body: bytes) -> bytes:
+    """Digest used to detect changed responses (status, type or body) between syncs"""
+
+    digest = hashlib.sha256()
+    digest.update(struct.pack('>H', status_code))
+    digest.update(content_type.encode('utf-8') + b'\0')
+    digest.update(body)
+    return digest.digest()
+
+
+class SitePack:
+    """Read-only, mmap-backed view of a pack file up to its last committed footer"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = 0  # end of the last committed footer, 0 if there is none
+        self._file = None
+        self._map = None
+        self._index_offset = 0
+        self._count = 0
+        self._open()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, path: str) -> Optional[PackEntry]:
+        """Look up the latest record stored for a path"""
+
+        slot = self._find_slot(path_key(path))
+        if slot is None:
+            return None
+
+        offset, _ = slot
+        return self._read_record(offset)
+
+    def slots(self) -> Dict[bytes, Tuple[int, int, bytes]]:
+        """Map every indexed key to its (offset, length, digest)"""
+
+        slots = {}
+        for i in range(self._count):
+            key, offset, length = INDEX_SLOT.unpack_from(self._map, self._index_offset + i * INDEX_SLOT.size)
+            digest = RECORD.unpack_from(self._map, offset)[4]
+            slots[key] = (offset, length, digest)
+        return slots
+
+    def close(self):
+        """Release the memory map and file handle"""
+
+        if self._map:
+            self._map.close()
+            self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        """Map the file and locate the latest index"""
+
+        if not os.path.exists(self.path):
+            return
+
+        size = os.path.getsize(self.path)
+        if size < FOOTER.size:
+            return
+
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        end = self._find_committed_end(size)
+        if not end:
+            # Never committed or foreign file - treat as empty
+            self.close()
+            return
+
+        if end != size:
+            # Only map committed bytes, so a writer may truncate what follows
+            self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), end, access=mmap.ACCESS_READ)
+
+        _, index_offset, count = FOOTER.unpack_from(self._map, end - FOOTER.size)
+        self.size = end
+        self._index_offset = index_offset
+        self._count = count
+
+    def _find_committed_end(self, end: int) -> int:
+        """Walk back from the end of the file to the last valid footer, returning where it ends"""
+
+        while end >= FOOTER.size:
+            footer_offset = end - FOOTER.size
+            magic, index_offset, count = FOOTER.unpack_from(self._map, footer_offset)
+            if magic == PACK_MAGIC and index_offset + count * INDEX_SLOT.size == footer_offset:
+                return end
+
+            # Next candidate footer must start before this one
+            candidate = self._map.rfind(PACK_MAGIC, 0, footer_offset + len(PACK_MAGIC) - 1)
+            if candidate < 0:
+                return 0
+            end = candidate + FOOTER.size
+
+        return 0
+
+    def _find_slot(self, key: bytes) -> Optional[Tuple[int, int]]:
+        """Binary search the sorted index for a key"""
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = self._index_offset + middle * INDEX_SLOT.size
+            slot_key = self._map[position:position + 16]
+            if slot_key < key:
+                low = middle + 1
+            elif slot_key > key:
+                high = middle
+            else:
+                _, offset, length = INDEX_SLOT.unpack_from(self._map, position)
+                return offset, length
+        return None
+
+    def _read_record(self, offset: int) -> PackEntry:
+        """Decode the record at an offset"""
+
+        path_len, type_len, status_code, body_len, digest = RECORD.unpack_from(self._map, offset)
+        position = offset + RECORD.size
+
+        path = self._map[position:position + path_len].decode('utf-8')
+        position += path_len
+        content_type = self._map[position:position + type_len].decode('utf-8')
+        position += type_len
+        body = self._map[position:position + body_len]
+
+        return PackEntry(path, content_type, status_code, digest, body)
+
+
+class PackWriter:
+    """Appends one sync's worth of records, reusing unchanged ones from the previous sync"""
+
+    def __init__(self, path: str, previous: Optional[SitePack] = None):
+        self.path = path
+        self.appended = 0
+        self.unchanged = 0
+        self._previous = previous.slots() if previous else {}
+        self._slots: Dict[bytes, Tuple[int, int]] = {}
+
+        # Not opened in append mode: truncate() would not move an O_APPEND write position
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+
+        # Drop anything after the last committed footer (e.g. a sync that was killed)
+        committed_end = previous.size if previous else 0
+        self._file.truncate(committed_end)
+        self._file.seek(committed_end)
+        self._start = self._offset = committed_end
+
+    def add(self, path: str, content_type: str, status_code: int, body: bytes) -> bool:
+        """Store a response, returning True if it had to be appended"""
+
+        key = path_key(path)
+        digest = entry_digest(content_type, status_code, body)
+
+        previous = self._previous.get(key)
+        if previous and previous[2] == digest:
+            self._slots[key] = previous[:2]
+            self.unchanged += 1
+            return False
+
+        path_bytes = path.encode('utf-8')
+        type_bytes = content_type.encode('utf-8')
+        header = RECORD.pack(len(path_bytes), len(type_bytes), status_code, len(body), digest)
+        record_len = len(header) + len(path_bytes) + len(type_bytes) + len(body)
+
+        self._file.write(header)
+        self._file.write(path_bytes)
+        self._file.write(type_bytes)
+        self._file.write(body)
+
+        self._slots[key] = (self._offset, record_len)
+        self._offset += record_len
+        self.appended += 1
+        return True
+
+    def keep(self, path: str) -> bool:
+        """Carry a path over from the previous sync unchanged, if it exists there"""
+
+        key = path_key(path)
+        previous = self._previous.get(key)
+        if not previous:
+            return False
+
+        self._slots[key] = previous[:2]
+        self.unchanged += 1
+        return True
+
+    def keep_remaining(self) -> int:
+        """Carry over every previous entry not already stored in this sync"""
+
+        remaining = [key for key in self._previous if key not in self._slots]
+        for key in remaining:
+            self._slots[key] = self._previous[key][:2]
+        self.unchanged += len(remaining)
+        return len(remaining)
+
+    def commit(self) -> int:
+        """Write the sorted index and footer, returning the number of entries"""
+
+        index_offset = self._offset
+        for key in sorted(self._slots):
+            offset, length = self._slots[key]
+            self._file.write(INDEX_SLOT.pack(key, offset, length))
+
+        self._file.write(FOOTER.pack(PACK_MAGIC, index_offset, len(self._slots)))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+        return len(self._slots)
+
+    def abort(self):
+        """Discard this sync's records, leaving the previous index in place"""
+
+        self._file.truncate(self._start)
+        self._file.close()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Local storage locations
+
+Resolves where MeshBrowser keeps data on disk (site mirrors, caches, etc.).
+"""
+
+import os
+
+
+# Root of all MeshBrowser data, overridable for portable or field installs
+DATA_DIR = os.environ.get('MESHBROWSER_DATA_DIR') or os.path.join(os.path.expanduser('~'), '.meshbrowser')
+
+
+def data_path(*parts: str) -> str:
+    """Build a path inside the data directory, creating parent directories as needed"""
+
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path